@@ -4,9 +4,13 @@ Simple theme preview server for RustPress themes.
 This allows previewing the theme templates without running the full RustPress server.
 """
 
+import functools
 import http.server
-import socketserver
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 from pathlib import Path
 
@@ -15,69 +19,114 @@ PORT = 8888
 THEME_DIR = Path(__file__).parent / "themes" / "rustpress-enterprise"
 TEMPLATES_DIR = THEME_DIR / "templates"
 
+# Request logs are queued by handler threads and written out by a single
+# listener thread started in main(), keeping stdout off the request path.
+LOG_QUEUE = queue.SimpleQueue()
+logger = logging.getLogger("preview-theme")
+logger.addHandler(logging.handlers.QueueHandler(LOG_QUEUE))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Tera/Jinja statement and expression tags, stripped in a single pass.
+# Matches raw bytes: the delimiters are ASCII and cannot occur inside a
+# multi-byte UTF-8 sequence, so templates never need decoding.
+TEMPLATE_TAG_RE = re.compile(rb'\{%.*?%\}|\{\{.*?\}\}', re.DOTALL)
+
+# Map paths to templates
+_RAW_MAP = {
+    '/': 'home.html',
+    '/home': 'home.html',
+    '/features': 'features.html',
+    '/pricing': 'pricing.html',
+    '/about': 'about.html',
+    '/contact': 'contact.html',
+    '/blog': 'blog.html',
+    '/post': 'post.html',
+    '/team': 'team.html',
+    '/integrations': 'integrations.html',
+    '/use-cases': 'use-cases.html',
+    '/customers': 'customers.html',
+    '/security': 'security.html',
+    '/enterprise': 'enterprise.html',
+    '/api': 'api.html',
+    '/docs': 'docs.html',
+    '/demo': 'demo.html',
+    '/changelog': 'changelog.html',
+    '/careers': 'careers.html',
+    '/privacy': 'privacy.html',
+    '/terms': 'terms.html',
+    '/404': '404.html',
+    '/500': '500.html',
+}
+
+# Resolved once at startup; routes whose template is missing fall through
+# to normal file serving.
+PATH_MAP = {
+    route: TEMPLATES_DIR / name
+    for route, name in _RAW_MAP.items()
+    if (TEMPLATES_DIR / name).is_file()
+}
+
+@functools.lru_cache(maxsize=64)
+def _load_stripped(path_str, mtime_ns):
+    """Read a template and strip its tags; keyed by mtime so edits invalidate it.
+
+    Returns the encoded body together with its Content-Length string.
+    """
+    body = Path(path_str).read_bytes()
+
+    # Basic Tera/Jinja template processing
+    # Replace common template tags with empty strings for preview
+    if b'{%' in body or b'{{' in body:
+        body = TEMPLATE_TAG_RE.sub(b'', body)
+    return body, str(len(body))
+
 class ThemeHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler for serving theme templates."""
 
+    # Keep-alive, so the browser's asset requests reuse their connections.
+    # Headers and body go out as separate writes, so Nagle must be off or
+    # every reused connection stalls on the client's delayed ACK.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(THEME_DIR), **kwargs)
 
     def do_GET(self):
-        # Map paths to templates
-        path_map = {
-            '/': 'home.html',
-            '/home': 'home.html',
-            '/features': 'features.html',
-            '/pricing': 'pricing.html',
-            '/about': 'about.html',
-            '/contact': 'contact.html',
-            '/blog': 'blog.html',
-            '/post': 'post.html',
-            '/team': 'team.html',
-            '/integrations': 'integrations.html',
-            '/use-cases': 'use-cases.html',
-            '/customers': 'customers.html',
-            '/security': 'security.html',
-            '/enterprise': 'enterprise.html',
-            '/api': 'api.html',
-            '/docs': 'docs.html',
-            '/demo': 'demo.html',
-            '/changelog': 'changelog.html',
-            '/careers': 'careers.html',
-            '/privacy': 'privacy.html',
-            '/terms': 'terms.html',
-            '/404': '404.html',
-            '/500': '500.html',
-        }
-
         # Clean path
-        clean_path = self.path.split('?')[0].rstrip('/')
-        if not clean_path:
-            clean_path = '/'
+        clean_path = self.path.partition('?')[0].rstrip('/') or '/'
 
         # Check if it's a template route
-        if clean_path in path_map:
-            template_file = TEMPLATES_DIR / path_map[clean_path]
-            if template_file.exists():
+        template_file = PATH_MAP.get(clean_path)
+        if template_file is not None:
+            try:
+                mtime_ns = template_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass  # Removed since startup; fall back to file serving
+            else:
+                body, length = _load_stripped(str(template_file), mtime_ns)
+
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', length)
                 self.end_headers()
-
-                content = template_file.read_text(encoding='utf-8')
-
-                # Basic Tera/Jinja template processing
-                # Replace common template tags with empty strings for preview
-                import re
-                content = re.sub(r'\{\%.*?\%\}', '', content)
-                content = re.sub(r'\{\{.*?\}\}', '', content)
-
-                self.wfile.write(content.encode('utf-8'))
+                self.wfile.write(body)
                 return
 
         # Fall back to normal file serving
         super().do_GET()
 
+    def copyfile(self, source, outputfile):
+        """Send static files with sendfile(2) instead of a userspace copy loop."""
+        if outputfile is self.wfile:
+            # socket.sendfile falls back to plain send() where sendfile is unsupported
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+
     def log_message(self, format, *args):
-        print(f"[{self.address_string()}] {format % args}")
+        logger.info("[%s] " + format, self.address_string(), *args)
 
 def main():
     print(f"\n{'='*60}")
@@ -95,11 +144,15 @@ def main():
         print(f"  - http://localhost:{PORT}{page}")
     print(f"\nPress Ctrl+C to stop the server.\n")
 
-    with socketserver.TCPServer(("", PORT), ThemeHandler) as httpd:
+    listener = logging.handlers.QueueListener(LOG_QUEUE, logging.StreamHandler(sys.stdout))
+    listener.start()
+    with http.server.ThreadingHTTPServer(("", PORT), ThemeHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\nServer stopped.")
+        finally:
+            listener.stop()
 
 if __name__ == "__main__":
     main()
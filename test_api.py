@@ -1,34 +1,59 @@
 #!/usr/bin/env python3
 """Test ALL RustPress API endpoints"""
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://127.0.0.1:8080"
 TOKEN = None
+AUTH_HEADERS = None  # Prebuilt from TOKEN by set_token()
 CREATED_IDS = {}
 TIMESTAMP = str(int(time.time()))  # Unique timestamp for test data
+MAX_WORKERS = 16
+POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS)  # Overlaps independent requests
+
+# One keep-alive connection pool shared by every call, sized for the workers
+# plus the main thread running the sequential create/update chains
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS + 1))
+SESSION.stream = False
+
+_METHODS = {
+    "GET": SESSION.get,
+    "POST": SESSION.post,
+    "PUT": SESSION.put,
+    "PATCH": SESSION.patch,
+    "DELETE": SESSION.delete,
+}
+_BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+def set_token(token):
+    """Store the access token and prebuild its Authorization header"""
+    global TOKEN, AUTH_HEADERS
+    TOKEN = token
+    AUTH_HEADERS = {"Authorization": f"Bearer {token}"}
+
+def test(method, endpoint, auth=False, data=None, expected=[200, 201, 204], read_body=False):
+    """Test an endpoint and return status; pass read_body=True to use r.json()"""
+    fn = _METHODS.get(method)
+    if fn is None:
+        return "UNKNOWN METHOD", None
 
-def test(method, endpoint, auth=False, data=None, expected=[200, 201, 204]):
-    """Test an endpoint and return status"""
     url = f"{BASE_URL}{endpoint}"
-    headers = {"Content-Type": "application/json"}
-    if auth and TOKEN:
-        headers["Authorization"] = f"Bearer {TOKEN}"
+    kwargs = {"headers": AUTH_HEADERS if auth else None, "timeout": 10, "stream": not read_body}
+    if method in _BODY_METHODS:
+        kwargs["json"] = data
 
     try:
-        if method == "GET":
-            r = requests.get(url, headers=headers, timeout=10)
-        elif method == "POST":
-            r = requests.post(url, headers=headers, json=data, timeout=10)
-        elif method == "PUT":
-            r = requests.put(url, headers=headers, json=data, timeout=10)
-        elif method == "PATCH":
-            r = requests.patch(url, headers=headers, json=data, timeout=10)
-        elif method == "DELETE":
-            r = requests.delete(url, headers=headers, timeout=10)
-        else:
-            return "UNKNOWN METHOD", None
+        r = fn(url, **kwargs)
+        if not read_body:
+            # Only the status is checked: discard the raw body without buffering
+            # or decoding it, which also hands the connection back to the pool
+            r.raw.drain_conn()
+            r.close()
 
         if isinstance(expected, list):
             status = "OK" if r.status_code in expected else "FAIL"
@@ -43,6 +68,22 @@ def p(method, endpoint, result):
     """Print result"""
     print(f"{method:6} {endpoint:45} {result}")
 
+def created_id(r):
+    """Return the id of a created resource, decoding the body only once"""
+    body = r.json()
+    return (body.get("data") or {}).get("id") or body.get("id")
+
+def submit_many(method, endpoints, auth=False):
+    """Start independent endpoint tests on the pool without waiting for them"""
+    return {endpoint: POOL.submit(test, method, endpoint, auth=auth) for endpoint in endpoints}
+
+def test_many(method, endpoints, auth=False, futures=None):
+    """Test independent endpoints concurrently and print results in order"""
+    if futures is None:
+        futures = submit_many(method, endpoints, auth=auth)
+    for endpoint in endpoints:
+        p(method, endpoint, futures[endpoint].result()[0])
+
 # ============================================
 # LOGIN
 # ============================================
@@ -51,33 +92,53 @@ print("RUSTPRESS API ENDPOINT TEST")
 print("=" * 70)
 
 print("\n[AUTH ENDPOINTS]")
-r = requests.post(f"{BASE_URL}/api/v1/auth/login",
-                  json={"email": "admin", "password": "admin123"}, timeout=10)
+r = SESSION.post(f"{BASE_URL}/api/v1/auth/login",
+                 json={"email": "admin", "password": "admin123"}, timeout=10)
 if r.status_code == 200:
-    TOKEN = r.json()["access_token"]
-    REFRESH = r.json().get("refresh_token")
+    body = r.json()
+    set_token(body["access_token"])
+    REFRESH = body.get("refresh_token")
     p("POST", "/api/v1/auth/login", "200 OK")
 else:
     p("POST", "/api/v1/auth/login", f"{r.status_code} FAIL - Cannot continue")
     exit(1)
 
-p("GET", "/api/v1/auth/me", test("GET", "/api/v1/auth/me", auth=True)[0])
-p("POST", "/api/v1/auth/refresh", test("POST", "/api/v1/auth/refresh", auth=True, data={"refresh_token": REFRESH})[0])
+# /auth/me and /auth/refresh both only need the login token (refresh issues a
+# new pair without revoking it), so they run together. Logout revokes that
+# token and must wait for both; the re-login must in turn follow the logout.
+me = POOL.submit(test, "GET", "/api/v1/auth/me", auth=True)
+refresh = POOL.submit(test, "POST", "/api/v1/auth/refresh", auth=True, data={"refresh_token": REFRESH})
+p("GET", "/api/v1/auth/me", me.result()[0])
+p("POST", "/api/v1/auth/refresh", refresh.result()[0])
 p("POST", "/api/v1/auth/logout", test("POST", "/api/v1/auth/logout", auth=True)[0])
 
 # Re-login after logout
-r = requests.post(f"{BASE_URL}/api/v1/auth/login", json={"email": "admin", "password": "admin123"})
-TOKEN = r.json()["access_token"]
+r = SESSION.post(f"{BASE_URL}/api/v1/auth/login", json={"email": "admin", "password": "admin123"}, timeout=10)
+set_token(r.json()["access_token"])
+
+# Read-only probes with no dependency on the write chains below, grouped by
+# the section that prints them. They are fired as one batch now so they
+# overlap with everything else; each section only waits for its own group.
+READONLY_GROUPS = {
+    "settings": ["/api/v1/settings", "/api/v1/settings/general", "/api/v1/settings/reading",
+                 "/api/v1/settings/writing", "/api/v1/settings/discussion", "/api/v1/settings/permalinks"],
+    "widgets": ["/api/v1/widgets", "/api/v1/widgets/types", "/api/v1/widgets/areas"],
+    "stats": ["/api/v1/stats/dashboard", "/api/v1/stats/posts"],
+    "plugins": ["/api/v1/plugins"],
+    "backups": ["/api/v1/backups"],
+    "seo": ["/api/v1/seo/settings"],
+    "cache": ["/api/v1/cache/stats"],
+    "cdn": ["/api/v1/cdn/config"],
+    "email": ["/api/v1/email/templates", "/api/v1/email/settings"],
+    "search": ["/api/v1/search?q=test"],
+}
+READONLY = submit_many("GET", [endpoint for group in READONLY_GROUPS.values() for endpoint in group], auth=True)
 
 # ============================================
 # PUBLIC ENDPOINTS
 # ============================================
 print("\n[PUBLIC ENDPOINTS]")
-p("GET", "/health", test("GET", "/health")[0])
-p("GET", "/metrics", test("GET", "/metrics")[0])
-p("GET", "/api/v1/posts", test("GET", "/api/v1/posts")[0])
-p("GET", "/api/v1/categories", test("GET", "/api/v1/categories")[0])
-p("GET", "/api/v1/tags", test("GET", "/api/v1/tags")[0])
+test_many("GET", ["/health", "/metrics", "/api/v1/posts", "/api/v1/categories", "/api/v1/tags"])
 
 # ============================================
 # POSTS
@@ -85,12 +146,12 @@ p("GET", "/api/v1/tags", test("GET", "/api/v1/tags")[0])
 print("\n[POSTS ENDPOINTS]")
 p("GET", "/api/v1/posts", test("GET", "/api/v1/posts", auth=True)[0])
 
-result, r = test("POST", "/api/v1/posts", auth=True, data={
+result, r = test("POST", "/api/v1/posts", auth=True, read_body=True, data={
     "title": "Test Post", "content": "<p>Test</p>", "status": "draft", "slug": f"test-post-api-{TIMESTAMP}"
 })
 p("POST", "/api/v1/posts", result)
 if r and r.status_code in [200, 201]:
-    post_id = r.json().get("data", {}).get("id")
+    post_id = created_id(r)
     CREATED_IDS["post"] = post_id
     p("GET", f"/api/v1/posts/{post_id[:8]}...", test("GET", f"/api/v1/posts/{post_id}", auth=True)[0])
     p("PUT", f"/api/v1/posts/{post_id[:8]}...", test("PUT", f"/api/v1/posts/{post_id}", auth=True, data={"title": "Updated"})[0])
@@ -103,12 +164,12 @@ p("GET", "/api/v1/posts/revisions (if any)", test("GET", f"/api/v1/posts/{CREATE
 print("\n[PAGES ENDPOINTS]")
 p("GET", "/api/v1/pages", test("GET", "/api/v1/pages", auth=True)[0])
 
-result, r = test("POST", "/api/v1/pages", auth=True, data={
+result, r = test("POST", "/api/v1/pages", auth=True, read_body=True, data={
     "title": "Test Page", "content": "<p>Page</p>", "status": "draft", "slug": f"test-page-api-{TIMESTAMP}"
 })
 p("POST", "/api/v1/pages", result)
 if r and r.status_code in [200, 201]:
-    page_id = r.json().get("data", {}).get("id")
+    page_id = created_id(r)
     CREATED_IDS["page"] = page_id
     p("GET", f"/api/v1/pages/{page_id[:8]}...", test("GET", f"/api/v1/pages/{page_id}", auth=True)[0])
     p("PUT", f"/api/v1/pages/{page_id[:8]}...", test("PUT", f"/api/v1/pages/{page_id}", auth=True, data={"title": "Updated Page"})[0])
@@ -117,15 +178,14 @@ if r and r.status_code in [200, 201]:
 # USERS
 # ============================================
 print("\n[USERS ENDPOINTS]")
-p("GET", "/api/v1/users", test("GET", "/api/v1/users", auth=True)[0])
-p("GET", "/api/v1/users/me", test("GET", "/api/v1/users/me", auth=True)[0])
+test_many("GET", ["/api/v1/users", "/api/v1/users/me"], auth=True)
 
-result, r = test("POST", "/api/v1/users", auth=True, data={
+result, r = test("POST", "/api/v1/users", auth=True, read_body=True, data={
     "email": f"test{TIMESTAMP}@example.com", "username": f"testuser{TIMESTAMP}", "password": "TestPass123", "role": "subscriber"
 })
 p("POST", "/api/v1/users", result)
 if r and r.status_code in [200, 201]:
-    user_id = r.json().get("data", {}).get("id") or r.json().get("id")
+    user_id = created_id(r)
     if user_id:
         CREATED_IDS["user"] = user_id
         p("GET", f"/api/v1/users/{user_id[:8]}...", test("GET", f"/api/v1/users/{user_id}", auth=True)[0])
@@ -135,8 +195,7 @@ if r and r.status_code in [200, 201]:
 # MEDIA
 # ============================================
 print("\n[MEDIA ENDPOINTS]")
-p("GET", "/api/v1/media", test("GET", "/api/v1/media", auth=True)[0])
-p("GET", "/api/v1/media/folders", test("GET", "/api/v1/media/folders", auth=True)[0])
+test_many("GET", ["/api/v1/media", "/api/v1/media/folders"], auth=True)
 
 # ============================================
 # COMMENTS
@@ -145,12 +204,12 @@ print("\n[COMMENTS ENDPOINTS]")
 p("GET", "/api/v1/comments", test("GET", "/api/v1/comments", auth=True)[0])
 
 if CREATED_IDS.get("post"):
-    result, r = test("POST", "/api/v1/comments", auth=True, data={
+    result, r = test("POST", "/api/v1/comments", auth=True, read_body=True, data={
         "post_id": CREATED_IDS["post"], "content": "Test comment", "author_name": "Tester", "author_email": "test@test.com"
     })
     p("POST", "/api/v1/comments", result)
     if r and r.status_code in [200, 201]:
-        comment_id = r.json().get("data", {}).get("id") or r.json().get("id")
+        comment_id = created_id(r)
         if comment_id:
             CREATED_IDS["comment"] = comment_id
             p("GET", f"/api/v1/comments/{comment_id[:8]}...", test("GET", f"/api/v1/comments/{comment_id}", auth=True)[0])
@@ -159,15 +218,14 @@ if CREATED_IDS.get("post"):
 # CATEGORIES
 # ============================================
 print("\n[CATEGORIES ENDPOINTS]")
-p("GET", "/api/v1/categories", test("GET", "/api/v1/categories", auth=True)[0])
-p("GET", "/api/v1/taxonomies/categories", test("GET", "/api/v1/taxonomies/categories", auth=True)[0])
+test_many("GET", ["/api/v1/categories", "/api/v1/taxonomies/categories"], auth=True)
 
-result, r = test("POST", "/api/v1/categories", auth=True, data={
+result, r = test("POST", "/api/v1/categories", auth=True, read_body=True, data={
     "name": f"Test Category {TIMESTAMP}", "slug": f"test-category-{TIMESTAMP}", "description": "A test category"
 })
 p("POST", "/api/v1/categories", result)
 if r and r.status_code in [200, 201]:
-    cat_id = r.json().get("data", {}).get("id") or r.json().get("id")
+    cat_id = created_id(r)
     if cat_id:
         CREATED_IDS["category"] = cat_id
         p("GET", f"/api/v1/categories/{cat_id[:8]}...", test("GET", f"/api/v1/categories/{cat_id}", auth=True)[0])
@@ -177,15 +235,14 @@ if r and r.status_code in [200, 201]:
 # TAGS
 # ============================================
 print("\n[TAGS ENDPOINTS]")
-p("GET", "/api/v1/tags", test("GET", "/api/v1/tags", auth=True)[0])
-p("GET", "/api/v1/taxonomies/tags", test("GET", "/api/v1/taxonomies/tags", auth=True)[0])
+test_many("GET", ["/api/v1/tags", "/api/v1/taxonomies/tags"], auth=True)
 
-result, r = test("POST", "/api/v1/tags", auth=True, data={
+result, r = test("POST", "/api/v1/tags", auth=True, read_body=True, data={
     "name": f"Test Tag {TIMESTAMP}", "slug": f"test-tag-{TIMESTAMP}"
 })
 p("POST", "/api/v1/tags", result)
 if r and r.status_code in [200, 201]:
-    tag_id = r.json().get("data", {}).get("id") or r.json().get("id")
+    tag_id = created_id(r)
     if tag_id:
         CREATED_IDS["tag"] = tag_id
         p("GET", f"/api/v1/tags/{tag_id[:8]}...", test("GET", f"/api/v1/tags/{tag_id}", auth=True)[0])
@@ -202,26 +259,20 @@ p("GET", "/api/v1/themes/active", test("GET", "/api/v1/themes/active", auth=True
 # SETTINGS
 # ============================================
 print("\n[SETTINGS ENDPOINTS]")
-p("GET", "/api/v1/settings", test("GET", "/api/v1/settings", auth=True)[0])
-p("GET", "/api/v1/settings/general", test("GET", "/api/v1/settings/general", auth=True)[0])
-p("GET", "/api/v1/settings/reading", test("GET", "/api/v1/settings/reading", auth=True)[0])
-p("GET", "/api/v1/settings/writing", test("GET", "/api/v1/settings/writing", auth=True)[0])
-p("GET", "/api/v1/settings/discussion", test("GET", "/api/v1/settings/discussion", auth=True)[0])
-p("GET", "/api/v1/settings/permalinks", test("GET", "/api/v1/settings/permalinks", auth=True)[0])
+test_many("GET", READONLY_GROUPS["settings"], futures=READONLY)
 
 # ============================================
 # MENUS
 # ============================================
 print("\n[MENUS ENDPOINTS]")
-p("GET", "/api/v1/menus", test("GET", "/api/v1/menus", auth=True)[0])
-p("GET", "/api/v1/menus/locations", test("GET", "/api/v1/menus/locations", auth=True)[0])
+test_many("GET", ["/api/v1/menus", "/api/v1/menus/locations"], auth=True)
 
-result, r = test("POST", "/api/v1/menus", auth=True, data={
+result, r = test("POST", "/api/v1/menus", auth=True, read_body=True, data={
     "name": f"Test Menu {TIMESTAMP}", "location": "primary"
 })
 p("POST", "/api/v1/menus", result)
 if r and r.status_code in [200, 201]:
-    menu_id = r.json().get("data", {}).get("id") or r.json().get("id")
+    menu_id = created_id(r)
     if menu_id:
         CREATED_IDS["menu"] = menu_id
         p("GET", f"/api/v1/menus/{menu_id[:8]}...", test("GET", f"/api/v1/menus/{menu_id}", auth=True)[0])
@@ -230,77 +281,77 @@ if r and r.status_code in [200, 201]:
 # WIDGETS
 # ============================================
 print("\n[WIDGETS ENDPOINTS]")
-p("GET", "/api/v1/widgets", test("GET", "/api/v1/widgets", auth=True)[0])
-p("GET", "/api/v1/widgets/types", test("GET", "/api/v1/widgets/types", auth=True)[0])
-p("GET", "/api/v1/widgets/areas", test("GET", "/api/v1/widgets/areas", auth=True)[0])
+test_many("GET", READONLY_GROUPS["widgets"], futures=READONLY)
 
 # ============================================
 # STATS / DASHBOARD
 # ============================================
 print("\n[STATS ENDPOINTS]")
-p("GET", "/api/v1/stats/dashboard", test("GET", "/api/v1/stats/dashboard", auth=True)[0])
-p("GET", "/api/v1/stats/posts", test("GET", "/api/v1/stats/posts", auth=True)[0])
+test_many("GET", READONLY_GROUPS["stats"], futures=READONLY)
 
 # ============================================
 # PLUGINS
 # ============================================
 print("\n[PLUGINS ENDPOINTS]")
-p("GET", "/api/v1/plugins", test("GET", "/api/v1/plugins", auth=True)[0])
+test_many("GET", READONLY_GROUPS["plugins"], futures=READONLY)
 
 # ============================================
 # BACKUPS
 # ============================================
 print("\n[BACKUPS ENDPOINTS]")
-p("GET", "/api/v1/backups", test("GET", "/api/v1/backups", auth=True)[0])
+test_many("GET", READONLY_GROUPS["backups"], futures=READONLY)
 
 # ============================================
 # SEO
 # ============================================
 print("\n[SEO ENDPOINTS]")
-p("GET", "/api/v1/seo/settings", test("GET", "/api/v1/seo/settings", auth=True)[0])
+test_many("GET", READONLY_GROUPS["seo"], futures=READONLY)
 
 # ============================================
 # CACHE
 # ============================================
 print("\n[CACHE ENDPOINTS]")
-p("GET", "/api/v1/cache/stats", test("GET", "/api/v1/cache/stats", auth=True)[0])
+test_many("GET", READONLY_GROUPS["cache"], futures=READONLY)
 p("POST", "/api/v1/cache/clear", test("POST", "/api/v1/cache/clear", auth=True)[0])
 
 # ============================================
 # CDN
 # ============================================
 print("\n[CDN ENDPOINTS]")
-p("GET", "/api/v1/cdn/config", test("GET", "/api/v1/cdn/config", auth=True)[0])
+test_many("GET", READONLY_GROUPS["cdn"], futures=READONLY)
 
 # ============================================
 # EMAIL
 # ============================================
 print("\n[EMAIL ENDPOINTS]")
-p("GET", "/api/v1/email/templates", test("GET", "/api/v1/email/templates", auth=True)[0])
-p("GET", "/api/v1/email/settings", test("GET", "/api/v1/email/settings", auth=True)[0])
+test_many("GET", READONLY_GROUPS["email"], futures=READONLY)
 
 # ============================================
 # SEARCH
 # ============================================
 print("\n[SEARCH ENDPOINTS]")
-p("GET", "/api/v1/search?q=test", test("GET", "/api/v1/search?q=test", auth=True)[0])
+test_many("GET", READONLY_GROUPS["search"], futures=READONLY)
 
 # ============================================
 # CLEANUP - Delete created test resources
 # ============================================
 print("\n[CLEANUP - Deleting test resources]")
-if CREATED_IDS.get("post"):
-    p("DELETE", f"/api/v1/posts/{CREATED_IDS['post'][:8]}...", test("DELETE", f"/api/v1/posts/{CREATED_IDS['post']}", auth=True)[0])
-if CREATED_IDS.get("page"):
-    p("DELETE", f"/api/v1/pages/{CREATED_IDS['page'][:8]}...", test("DELETE", f"/api/v1/pages/{CREATED_IDS['page']}", auth=True)[0])
-if CREATED_IDS.get("category"):
-    p("DELETE", f"/api/v1/categories/{CREATED_IDS['category'][:8]}...", test("DELETE", f"/api/v1/categories/{CREATED_IDS['category']}", auth=True)[0])
-if CREATED_IDS.get("tag"):
-    p("DELETE", f"/api/v1/tags/{CREATED_IDS['tag'][:8]}...", test("DELETE", f"/api/v1/tags/{CREATED_IDS['tag']}", auth=True)[0])
-if CREATED_IDS.get("menu"):
-    p("DELETE", f"/api/v1/menus/{CREATED_IDS['menu'][:8]}...", test("DELETE", f"/api/v1/menus/{CREATED_IDS['menu']}", auth=True)[0])
-if CREATED_IDS.get("user"):
-    p("DELETE", f"/api/v1/users/{CREATED_IDS['user'][:8]}...", test("DELETE", f"/api/v1/users/{CREATED_IDS['user']}", auth=True)[0])
+CLEANUP = [
+    ("post", "/api/v1/posts/"),
+    ("page", "/api/v1/pages/"),
+    ("category", "/api/v1/categories/"),
+    ("tag", "/api/v1/tags/"),
+    ("menu", "/api/v1/menus/"),
+    ("user", "/api/v1/users/"),
+]
+# The deletes are independent of each other, so issue them together
+deletes = [(base, CREATED_IDS[key]) for key, base in CLEANUP if CREATED_IDS.get(key)]
+futures = [POOL.submit(test, "DELETE", base + rid, auth=True) for base, rid in deletes]
+for (base, rid), future in zip(deletes, futures):
+    p("DELETE", f"{base}{rid[:8]}...", future.result()[0])
+
+POOL.shutdown()
+SESSION.close()
 
 print("\n" + "=" * 70)
 print("TEST COMPLETE")